@@ -0,0 +1,286 @@
+"""Benchmarks for the simulation and graph algorithms.
+
+Every case builds a seeded workload, so two runs with the same seed and scale
+time exactly the same work. Usage:
+
+    python bench.py                          # run every case
+    python bench.py dijkstra prim -r 10      # selected cases, 10 repeats
+    python bench.py --json new.json --compare old.json
+    python bench.py kruskal --profile --memory
+"""
+import argparse
+import cProfile
+import io
+import json
+import platform
+import pstats
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import CoM
+import collision
+import projectiles
+from dijkstras import dijkstra
+from kruskals import kruskal
+from prims import prim
+
+# Workload generators
+def random_graph(num_nodes, num_edges, seed=0, max_weight=100):
+    """Return a connected undirected graph in the {node: {neighbor: weight}} form.
+
+    A random spanning tree guarantees connectivity, then extra random edges are
+    added until the graph has num_edges edges.
+    """
+    if not num_nodes - 1 <= num_edges <= num_nodes * (num_nodes - 1) // 2:
+        raise ValueError(f'{num_edges} edges cannot form a connected simple graph on {num_nodes} nodes')
+    rng = random.Random(seed)
+    graph = {node: {} for node in range(num_nodes)}
+    order = list(graph)
+    rng.shuffle(order)
+    for i in range(1, num_nodes):
+        u, v = order[i], order[rng.randrange(i)]
+        graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+    edges = num_nodes - 1
+    while edges < num_edges:
+        u, v = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        if u != v and v not in graph[u]:
+            graph[u][v] = graph[v][u] = rng.randint(1, max_weight)
+            edges += 1
+    return graph
+
+def particle_ensemble(num_particles, seed=0, width=collision.width):
+    """Return collision.Particle objects with random positions and velocities."""
+    rng = random.Random(seed)
+    return [collision.Particle(x=rng.uniform(0.05, width - 0.05), vx=rng.uniform(-2.0, 2.0), mass=rng.uniform(0.5, 2.0))
+            for _ in range(num_particles)]
+
+def pendulum_sweep(num_angles, seed=0):
+    """Return random initial (theta, omega) pairs for the pendulum."""
+    rng = random.Random(seed)
+    return [(rng.uniform(-np.pi, np.pi), rng.uniform(-1.0, 1.0)) for _ in range(num_angles)]
+
+def projectile_batch(num_particles, seed=0):
+    """Return projectiles.Particle objects with random launch velocity and angle."""
+    rng = random.Random(seed)
+    return [projectiles.Particle(0, 0, rng.uniform(10, 100), 1, 0.1, rng.uniform(5, 85))
+            for _ in range(num_particles)]
+
+# Cases: each takes (seed, scale) and returns a setup function. Calling setup
+# builds fresh state outside the timed region and returns the callable to time.
+def case_runge_kutta_step(seed, scale):
+    starts = pendulum_sweep(20 * scale, seed)
+
+    def setup():
+        def run():
+            for theta, omega in starts:
+                for _ in range(1000):
+                    theta, omega = CoM.runge_kutta_step(theta, omega, CoM.dt)
+        return run
+    return setup
+
+def case_collide_with_particle(seed, scale):
+    def setup():
+        particles = particle_ensemble(50 * scale, seed)
+
+        def run():
+            # Same per-frame work as the collision demo's update()
+            for _ in range(100):
+                for p in particles:
+                    p.move(collision.time_step)
+                    p.collide_with_walls(collision.width)
+                for i in range(len(particles)):
+                    for j in range(i + 1, len(particles)):
+                        particles[i].collide_with_particle(particles[j], collision.initial_restitution)
+        return run
+    return setup
+
+def case_particle_move(seed, scale):
+    def setup():
+        batch = projectile_batch(1000 * scale, seed)
+
+        def run():
+            for _ in range(100):
+                for p in batch:
+                    p.move(projectiles.dt)
+        return run
+    return setup
+
+def case_dijkstra(seed, scale):
+    graph = random_graph(500 * scale, 2500 * scale, seed)
+    return lambda: lambda: dijkstra(graph, 0)
+
+def case_prim(seed, scale):
+    graph = random_graph(2000 * scale, 10000 * scale, seed)
+    return lambda: lambda: prim(graph, 0)
+
+def case_kruskal(seed, scale):
+    graph = random_graph(2000 * scale, 10000 * scale, seed)
+    return lambda: lambda: kruskal(graph)
+
+def case_launch_angles(seed, scale):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(1, 250, 10000 * scale)
+    y = rng.uniform(-20, 20, 10000 * scale)
+    # Build the cached drag table up front so every repeat times queries only
+    projectiles.launch_angles(x[:1], 50, y[:1], drag=0.002)
+    return lambda: lambda: projectiles.launch_angles(x, 50, y, drag=0.002)
+
+CASES = {
+    'runge_kutta_step': case_runge_kutta_step,
+    'collide_with_particle': case_collide_with_particle,
+    'particle_move': case_particle_move,
+    'dijkstra': case_dijkstra,
+    'prim': case_prim,
+    'kruskal': case_kruskal,
+    'launch_angles': case_launch_angles,
+}
+
+# Timing
+def time_case(setup, warmup, repeats):
+    """Return the wall-clock time in seconds of each timed repeat."""
+    for _ in range(warmup):
+        setup()()
+    times = []
+    for _ in range(repeats):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return times
+
+def profile_case(setup, limit=15):
+    """Run the case once under cProfile and return the top functions by cumulative time."""
+    run = setup()
+    profiler = cProfile.Profile()
+    profiler.runcall(run)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+    return out.getvalue()
+
+def peak_memory(setup):
+    """Run the case once under tracemalloc and return the peak traced bytes."""
+    run = setup()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def compare(results, baseline, threshold):
+    """Print median changes against a previous JSON run; return the regressed case names.
+
+    Cases absent from the baseline are listed as new, and baseline cases that
+    were not run this time as missing.
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline['results'].get(name)
+        if old is None:
+            print(f'{name:<24} {"new":>13} -> {result["median"] * 1000:10.3f} ms')
+            continue
+        ratio = result['median'] / old['median']
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f'{name:<24} {old["median"] * 1000:10.3f} ms -> {result["median"] * 1000:10.3f} ms  x{ratio:.2f}{flag}')
+    for name in baseline['results']:
+        if name not in results:
+            print(f'{name:<24} {baseline["results"][name]["median"] * 1000:10.3f} ms -> {"missing":>13}')
+    return regressions
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be a positive integer, got {value}')
+    return number
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f'must be a non-negative integer, got {value}')
+    return number
+
+def non_negative_float(value):
+    number = float(value)
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f'must be a non-negative number, got {value}')
+    return number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('cases', nargs='*', metavar='case',
+                        help=f'cases to run (default: all of {", ".join(CASES)})')
+    parser.add_argument('-r', '--repeats', type=positive_int, default=5)
+    parser.add_argument('-w', '--warmup', type=non_negative_int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--scale', type=positive_int, default=1, help='multiply every workload size by this factor')
+    parser.add_argument('--profile', action='store_true', help='capture a cProfile summary per case')
+    parser.add_argument('--memory', action='store_true', help='capture peak tracemalloc usage per case')
+    parser.add_argument('--json', metavar='FILE', help='write results as JSON to FILE')
+    parser.add_argument('--compare', metavar='FILE', help='compare medians against a previous --json run')
+    parser.add_argument('--threshold', type=non_negative_float, default=0.1,
+                        help='relative slowdown reported as a regression (default: 0.1)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f'unknown case(s): {", ".join(unknown)}')
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        # Different seeds or scales time different work, so medians are not comparable
+        mismatched = [key for key in ('seed', 'scale') if baseline.get(key) != getattr(args, key)]
+        if mismatched:
+            parser.error(', '.join(f'--{key} {getattr(args, key)} does not match {args.compare} ({baseline.get(key)})'
+                                   for key in mismatched))
+        if baseline.get('warmup') != args.warmup:
+            print(f'note: --warmup {args.warmup} differs from {args.compare} ({baseline.get("warmup")})')
+
+    results = {}
+    for name in args.cases or CASES:
+        setup = CASES[name](args.seed, args.scale)
+        times = time_case(setup, args.warmup, args.repeats)
+        result = {
+            'repeats': args.repeats,
+            'times': times,
+            'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.mean(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        }
+        print(f'{name:<24} median {result["median"] * 1000:10.3f} ms  min {result["min"] * 1000:10.3f} ms')
+        if args.memory:
+            result['peak_memory'] = peak_memory(setup)
+            print(f'{"":<24} peak memory {result["peak_memory"] / 1024:.1f} KiB')
+        if args.profile:
+            result['profile'] = profile_case(setup)
+            print(result['profile'])
+        results[name] = result
+
+    if args.json:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'scale': args.scale,
+            'warmup': args.warmup,
+            'results': results,
+        }
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if baseline is not None:
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Guard the import time of the simulation and graph modules.
+
+Runs ``python -X importtime -c "import <module>"`` for each module in a fresh
+interpreter and fails if importing it pulls in a plotting/graph library or
+takes longer than its budget. Usage:
+
+    python check_imports.py
+"""
+import os
+import subprocess
+import sys
+
+# Libraries that must only be loaded when a visualization is requested
+HEAVY = ('matplotlib', 'networkx', 'openai')
+
+# Cumulative import budget per module in milliseconds. CoM and projectiles
+# need numpy for their numerics, so they get a larger allowance.
+BUDGETS = {
+    'dijkstras': 50,
+    'prims': 50,
+    'kruskals': 50,
+    'collision': 50,
+    'CoM': 500,
+    'projectiles': 500,
+}
+
+def import_profile(module):
+    """Return {imported name: cumulative microseconds} for importing module."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+def main():
+    failures = []
+    for module, budget in BUDGETS.items():
+        profile = import_profile(module)
+        elapsed = profile[module] / 1000
+        heavy = sorted({name.split('.')[0] for name in profile} & set(HEAVY))
+        print(f'{module:<12} {elapsed:8.1f} ms  (budget {budget} ms)')
+        if heavy:
+            failures.append(f'{module} imports {", ".join(heavy)}')
+        if elapsed > budget:
+            failures.append(f'{module} took {elapsed:.1f} ms, budget is {budget} ms')
+
+    for failure in failures:
+        print('FAIL:', failure)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
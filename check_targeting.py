@@ -0,0 +1,115 @@
+"""Sanity checks for the inverse targeting solver in projectiles.py.
+
+Compares the drag tables against the closed-form vacuum solutions as drag
+goes to 0, replays drag solutions through a fine integration, and checks
+that unreachable or invalid targets give nan. Usage:
+
+    python check_targeting.py
+"""
+import sys
+import warnings
+
+import numpy as np
+
+from projectiles import _trajectories, launch_angles, min_launch_velocity
+
+TINY_DRAG = 1e-9
+
+def check(failures, name, ok):
+    print(f'{"ok" if ok else "FAIL":<5} {name}')
+    if not ok:
+        failures.append(name)
+
+def miss(x, y, velocity, angle, drag):
+    """Closest approach of a finely integrated drag trajectory to (x, y).
+
+    Steep shots cross a target's x almost vertically, so a height error there
+    overstates how far the shot actually misses.
+    """
+    floor = min(y, 0.0) - x
+    xs, ys, _ = _trajectories(velocity, drag, 1.0, 9.8, np.array([angle]), floor, 2 * x, steps=40000)
+    return np.hypot(xs[:, 0] - x, ys[:, 0] - y).min()
+
+def main():
+    failures = []
+
+    # Tiny drag should match the vacuum solutions, including targets below
+    # the launch point and launches far faster than the demo's sliders
+    for velocity, xs, ys in [
+        (50, [5, 50, 100, 200, 250, 100], [0, 0, 10, -20, 0, -50]),
+        (1000, [1000, 20000, 50000, 90000], [0, 0, 0, -1000]),
+    ]:
+        vacuum = np.array(launch_angles(xs, velocity, ys))
+        drag = np.array(launch_angles(xs, velocity, ys, drag=TINY_DRAG))
+        check(failures, f'launch_angles matches vacuum at {velocity} m/s',
+              np.allclose(drag, vacuum, atol=0.1))
+
+    # Deep targets (|y| > x, and below -v^2/g of the slowest table rows) too
+    xs = np.array([1, 50, 100, 200, 300, 0.2, 10, 5, 9.2, 50, 3, 30])
+    ys = np.array([0, 0, 10, -20, 0, 0.05, 40, -20, -12.5, -60, -100, -300])
+    vacuum = np.array(min_launch_velocity(xs, ys))
+    drag = np.array(min_launch_velocity(xs, ys, drag=TINY_DRAG))
+    check(failures, 'min_launch_velocity matches vacuum',
+          np.allclose(drag[0], vacuum[0], rtol=0.01) and np.allclose(drag[1], vacuum[1], atol=1.0))
+    vacuum = np.array(min_launch_velocity(60000))
+    drag = np.array(min_launch_velocity(60000, drag=TINY_DRAG, max_velocity=1000))
+    check(failures, 'min_launch_velocity matches vacuum at 1000 m/s', np.allclose(drag, vacuum, rtol=0.01))
+
+    # Real drag: the returned angles should hit the target when replayed
+    xs, ys = np.array([20.0, 60.0, 120.0, 9.2]), np.array([0.0, 5.0, -10.0, -12.5])
+    low, high = launch_angles(xs, 50, ys, drag=0.002)
+    errors = [miss(x, y, 50, angle, 0.002) for x, y, pair in zip(xs, ys, zip(low, high)) for angle in pair]
+    check(failures, 'drag launch_angles hit their targets', max(errors) < 0.2)
+    low, high = launch_angles(50, 50, -300, drag=0.002)
+    check(failures, 'drag launch_angles hit a target far below the launch point',
+          max(miss(50, -300, 50, low, 0.002), miss(50, -300, 50, high, 0.002)) < 0.2)
+    velocity, angle = min_launch_velocity(xs, ys, drag=0.002)
+    errors = [miss(x, y, v, a, 0.002) for x, y, v, a in zip(xs, ys, velocity, angle)]
+    check(failures, 'drag min_launch_velocity hits its targets', max(errors) < 0.2)
+    velocity, angle = min_launch_velocity(97, 0.9, drag=0.02)
+    check(failures, 'heavy drag min_launch_velocity hits its target', miss(97, 0.9, velocity, angle, 0.02) < 0.2)
+    # Slightly faster than the minimum must always reach the target
+    velocity, _ = min_launch_velocity(xs, ys, drag=0.002)
+    check(failures, 'launch_angles reaches targets just above min_launch_velocity',
+          all(np.isfinite(launch_angles(x, v * 1.01, y, drag=0.002)).all() for x, y, v in zip(xs, ys, velocity)))
+
+    # Unreachable targets: out of range or too high
+    for label, result in [
+        ('vacuum beyond range', launch_angles(300, 50)),
+        ('drag beyond range', launch_angles(300, 50, drag=0.002)),
+        ('drag above reach', launch_angles(10, 50, 200, drag=0.002)),
+        ('min velocity beyond max_velocity', min_launch_velocity(2000, drag=0.002)),
+    ]:
+        check(failures, f'nan for {label}', np.isnan(result).all())
+
+    # Invalid inputs follow the same rules with and without drag, without warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        for drag in (0.0, 0.002):
+            for label, result in [
+                ('x = 0', launch_angles(0, 50, drag=drag)),
+                ('negative x', launch_angles(-10, 50, drag=drag)),
+                ('zero velocity', launch_angles(10, 0, drag=drag)),
+                ('negative velocity', launch_angles(10, -50, drag=drag)),
+                ('non-finite targets', launch_angles([np.nan, np.inf, 10], 50, [0, 0, -np.inf], drag=drag)),
+                ('min velocity at x = 0', min_launch_velocity(0, drag=drag)),
+                ('min velocity at negative x', min_launch_velocity(-10, drag=drag)),
+                ('min velocity of non-finite targets',
+                 min_launch_velocity([np.nan, np.inf, 10], [0, 0, np.nan], drag=drag)),
+            ]:
+                check(failures, f'nan for {label} (drag={drag})', np.isnan(result).all())
+            scalars = launch_angles(10, 50, drag=drag) + min_launch_velocity(10, drag=drag)
+            check(failures, f'scalar targets give np.float64 (drag={drag})',
+                  all(type(value) is np.float64 for value in scalars))
+    for function, args in [(launch_angles, (10, 50)), (min_launch_velocity, (10,))]:
+        try:
+            function(*args, drag=-0.1)
+        except ValueError:
+            check(failures, f'{function.__name__} rejects negative drag', True)
+        else:
+            check(failures, f'{function.__name__} rejects negative drag', False)
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,4 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import networkx as nx
 import heapq
-import matplotlib.animation as animation
 
 def dijkstra(graph, start):
     priority_queue = [(0, start)]
@@ -50,6 +46,11 @@ def get_user_input():
     return matrix, start_node, end_node
 
 def visualize_dijkstra(graph, start, end):
+    # Keep networkx/matplotlib out of module import so dijkstra() alone loads quickly
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    import networkx as nx
+
     distances, shortest_path_tree, steps = dijkstra(graph, start)
 
     G = nx.Graph(graph)
@@ -1,9 +1,3 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import networkx as nx
-import heapq
-import matplotlib.animation as animation
-
 class UnionFind:
     def __init__(self, nodes):
         self.parent = {node: node for node in nodes}
@@ -61,6 +55,10 @@ def get_user_input():
     return matrix
 
 def visualize_kruskal(graph):
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    import networkx as nx
+
     mst_edges, steps = kruskal(graph)
 
     G = nx.Graph()
@@ -1,8 +1,4 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import networkx as nx
 import heapq
-import matplotlib.animation as animation
 
 def prim(graph, start):
     priority_queue = [(0, start, None)]  # (weight, current_node, previous_node)
@@ -47,6 +43,11 @@ def get_user_input():
     return matrix, start_node
 
 def visualize_prim(graph, start):
+    # networkx and matplotlib are only used for drawing
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    import networkx as nx
+
     mst_edges, steps = prim(graph, start)
 
     G = nx.Graph()
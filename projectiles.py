@@ -1,11 +1,7 @@
-import openai
 import math
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from functools import lru_cache
 import numpy as np
-from matplotlib.widgets import Slider, Button
 
-# Initialize OpenAI API
 class Particle:
     def __init__(self, x, y, velocity, mass, radius, theta):
         self.x = x  # Position on the x-axis
@@ -34,92 +30,361 @@ class Particle:
         max_height = self.y0 + self.vy * t_max_height - 0.5 * self.g * t_max_height ** 2
         return max_height
     
+# Inverse targeting: launch parameters that land on a given target
+def launch_angles(target_x, velocity, target_y=0.0, drag=0.0, mass=1.0, g=9.8):
+    """Return the (low, high) launch angles in degrees that hit each target.
+
+    Targets may be scalars or arrays and must lie in front of the launch
+    point (x > 0); unreachable or invalid targets, or a velocity that is not
+    positive, give nan. With drag > 0 (quadratic drag coefficient) the angles
+    are interpolated from a cached table of trajectory heights over angles
+    from -90 to 90 degrees, built once per velocity and depth of the lowest
+    target.
+    """
+    if drag < 0:
+        raise ValueError(f'drag must be non-negative, got {drag}')
+    x, y, valid = _targets(target_x, target_y)
+    if not (np.isfinite(velocity) and velocity > 0):
+        low = high = np.full(x.shape, np.nan)
+    elif drag > 0:
+        low, high = _drag_launch_angles(np.where(valid, x, 1.0), np.where(valid, y, 0.0), valid,
+                                        velocity, drag, mass, g)
+    else:
+        v2 = velocity ** 2
+        # tan(theta) = (v^2 +- sqrt(v^4 - g(g x^2 + 2 y v^2))) / (g x)
+        with np.errstate(invalid='ignore', over='ignore'):
+            root = np.sqrt(v2 ** 2 - g * (g * x ** 2 + 2 * y * v2))
+            low = np.degrees(np.arctan2(v2 - root, g * x))
+            high = np.degrees(np.arctan2(v2 + root, g * x))
+    return np.where(valid, low, np.nan)[()], np.where(valid, high, np.nan)[()]
+
+def min_launch_velocity(target_x, target_y=0.0, drag=0.0, mass=1.0, g=9.8, max_velocity=100.0):
+    """Return the minimum launch velocity and its angle in degrees for each target.
+
+    Targets must lie in front of the launch point (x > 0); non-finite targets
+    give nan, and drag must be non-negative. With drag > 0 the result is
+    interpolated from a cached table of the furthest reach for velocities up
+    to max_velocity (in steps of max_velocity / 50, refined below the first
+    step), integrated down to the next power-of-two multiple of
+    max_velocity^2 / g below the lowest target. Building a table takes a few
+    seconds on first use. Targets that need more than max_velocity give nan,
+    and answers that need close to max_velocity under heavy drag are the
+    least accurate, so leave some headroom when choosing it.
+    """
+    if drag < 0:
+        raise ValueError(f'drag must be non-negative, got {drag}')
+    x, y, valid = _targets(target_x, target_y)
+    if drag > 0:
+        velocity, angle = _drag_min_velocity(np.where(valid, x, 1.0), np.where(valid, y, 0.0), valid,
+                                             drag, mass, g, max_velocity)
+    else:
+        # v_min^2 = g (y + sqrt(x^2 + y^2)), reached at tan(theta) = (y + r) / x
+        with np.errstate(invalid='ignore', over='ignore'):
+            r = np.hypot(x, y)
+            velocity = np.sqrt(g * (y + r))
+            angle = np.degrees(np.arctan2(y + r, x))
+    return np.where(valid, velocity, np.nan)[()], np.where(valid, angle, np.nan)[()]
+
+def _targets(target_x, target_y):
+    """Broadcast target coordinates and flag the finite ones in front of the launch point."""
+    x, y = np.broadcast_arrays(np.asarray(target_x, dtype=float), np.asarray(target_y, dtype=float))
+    return x, y, np.isfinite(x) & np.isfinite(y) & (x > 0)
+
+def _depth_level(y, valid, scale):
+    """Smallest power of two n such that -n * scale is strictly below every valid target."""
+    lowest = np.min(y, where=valid, initial=0.0)
+    return 1 if lowest > -scale else 2 ** (math.floor(math.log2(-lowest / scale)) + 1)
+
+def _flight_time(velocity, drag, mass, g, depth):
+    """Upper bound on the time any launch takes to fall depth below the launch point.
+
+    Rising takes at most v / g, then the fall of at most depth + v^2 / 2g from
+    rest takes (v_t / g) arccosh(exp(g d / v_t^2)) against quadratic drag with
+    terminal velocity v_t. Horizontal motion adds drag, so the total is doubled.
+    """
+    fall_depth = depth + velocity ** 2 / (2 * g)
+    terminal = math.sqrt(g * mass / drag)
+    u = g * fall_depth / terminal ** 2
+    # arccosh(exp(u)) written to stay accurate for both tiny and huge u
+    fall = terminal / g * (u + math.log1p(math.sqrt(-math.expm1(-2 * u))))
+    return 2 * (velocity / g + fall)
+
+def _trajectories(velocity, drag, mass, g, angles, floor, max_distance, steps=4000):
+    """Integrate one trajectory per launch angle with quadratic drag.
+
+    Returns the x and y positions at each time step, shape (steps, angles),
+    and whether each trajectory finished, i.e. fell below floor or passed
+    max_distance, within the time bound from _flight_time.
+    """
+    k = drag / mass
+    dt = _flight_time(velocity, drag, mass, g, -floor) / steps
+    vx = velocity * np.cos(np.radians(angles))
+    vy = velocity * np.sin(np.radians(angles))
+    x = np.zeros(len(angles))
+    y = np.zeros(len(angles))
+    xs, ys = [x], [y]
+    for _ in range(steps):
+        # Midpoint step for the drag, using the velocity half a step ahead
+        speed = np.hypot(vx, vy)
+        vx_mid = vx - 0.5 * k * speed * vx * dt
+        vy_mid = vy - 0.5 * (g + k * speed * vy) * dt
+        speed = np.hypot(vx_mid, vy_mid)
+        vx_new = vx - k * speed * vx_mid * dt
+        vy_new = vy - (g + k * speed * vy_mid) * dt
+        # Average the old and new velocity, which is exact without drag
+        x = x + 0.5 * (vx + vx_new) * dt
+        y = y + 0.5 * (vy + vy_new) * dt
+        vx, vy = vx_new, vy_new
+        xs.append(x)
+        ys.append(y)
+        finished = (y < floor) | (x > max_distance)
+        if finished.all():
+            break
+    return np.array(xs), np.array(ys), finished
+
+def _build_heights(velocity, drag, mass, g, floor, steps=721, x_steps=512):
+    """Height of each trajectory at each x, shape (angles, x_steps).
+
+    Angles run from -90 to 90 degrees. Distances are spaced quadratically, for
+    fine resolution at short range, out to a little beyond the vacuum reach
+    at floor, which no trajectory with drag can exceed. Heights are clipped
+    below at floor, which also covers distances a trajectory fell short of.
+    Distances a trajectory had not reached when the time bound ran out are
+    nan. Horizontal speed only ever decreases, so each trajectory is a
+    single-valued height over x.
+    """
+    r = velocity ** 2 / g
+    angles = np.linspace(-90, 90, steps)
+    distances = 1.2 * math.sqrt(r * (r - 2 * floor)) * np.linspace(0, 1, x_steps) ** 2
+    xs, ys, finished = _trajectories(velocity, drag, mass, g, angles, floor, distances[-1])
+    heights = np.array([np.interp(distances, xs[:, i], ys[:, i], right=floor if finished[i] else np.nan)
+                        for i in range(steps)])
+    return angles, distances, np.maximum(heights, floor)
+
+@lru_cache(maxsize=16)
+def _angle_table(velocity, drag, mass, g, level):
+    """Per-distance lookup tables for inverting height over launch angle.
+
+    The table reaches down to -level * velocity^2 / g. At a fixed distance the
+    height rises with angle up to a peak and falls after it. Both branches of
+    every distance column are stored as one sorted array of keys
+    column * span + (height - floor), so a single np.interp call answers
+    targets that fall in different columns.
+    """
+    r = velocity ** 2 / g
+    floor = -level * r
+    angles, distances, heights = _build_heights(velocity, drag, mass, g, floor)
+    # Heights lie between floor and the vertical apex r / 2
+    span = (level + 1) * r
+    peak = np.argmax(np.nan_to_num(heights, nan=-np.inf), axis=0)
+    rise_keys, rise_angles, fall_keys, fall_angles = [], [], [], []
+    for j, p in enumerate(peak):
+        # Columns with truncated trajectories are masked out by 'valid'; keep their keys sorted
+        column = np.nan_to_num(heights[:, j], nan=floor) - floor + j * span
+        rise_keys.append(np.maximum.accumulate(column[:p + 1]))
+        rise_angles.append(angles[:p + 1])
+        fall_keys.append(np.maximum.accumulate(column[p:][::-1]))
+        fall_angles.append(angles[p:][::-1])
+    return {
+        'floor': floor,
+        'span': span,
+        'distances': distances,
+        'peaks': heights[peak, np.arange(len(distances))],
+        'valid': ~np.isnan(heights).any(axis=0),
+        'rise': (np.concatenate(rise_keys), np.concatenate(rise_angles)),
+        'fall': (np.concatenate(fall_keys), np.concatenate(fall_angles)),
+    }
+
+def _drag_launch_angles(x, y, valid, velocity, drag, mass, g):
+    level = _depth_level(y, valid, velocity ** 2 / g)
+    table = _angle_table(float(velocity), float(drag), float(mass), float(g), level)
+    distances, peaks, span, floor = table['distances'], table['peaks'], table['span'], table['floor']
+    # Distances are quadratic in the grid index; blend the answers of the two
+    # neighbouring columns rather than their heights
+    pos = np.sqrt(np.clip(x / distances[-1], 0, 1)) * (len(distances) - 1)
+    j = np.clip(np.floor(pos).astype(int), 1, len(distances) - 2)
+    w = np.clip(pos - j, 0, 1)
+    low = np.zeros(x.shape)
+    high = np.zeros(x.shape)
+    for column, weight in ((j, 1 - w), (j + 1, w)):
+        key = column * span + np.clip(np.minimum(y, peaks[column]), floor, None) - floor
+        low += weight * np.interp(key, *table['rise'])
+        high += weight * np.interp(key, *table['fall'])
+    ceiling = (1 - w) * peaks[j] + w * peaks[j + 1]
+    unreachable = ((x > distances[-1]) | (y < floor) | (y > ceiling)
+                   | ~table['valid'][j] | ~table['valid'][j + 1])
+    low[unreachable] = np.nan
+    high[unreachable] = np.nan
+    return low, high
+
+@lru_cache(maxsize=16)
+def _reach_table(drag, mass, g, max_velocity, level, velocity_steps=50):
+    """Furthest reach over height, with its launch angle, for a grid of velocities.
+
+    Every velocity is integrated down to the shared floor
+    -level * max_velocity^2 / g on its own distance scale. The highest point
+    reachable at each distance falls as the distance grows, so it can be
+    inverted into the furthest distance reachable at each height. Rows are
+    stored with height increasing.
+    """
+    floor = -level * max_velocity ** 2 / g
+    # Evenly spaced rows, plus rows halving below the first for very short targets
+    step = max_velocity / velocity_steps
+    velocities = np.concatenate((step * 0.5 ** np.arange(6, 0, -1), np.linspace(step, max_velocity, velocity_steps)))
+    rows = []
+    for velocity in velocities:
+        angles, distances, heights = _build_heights(velocity, drag, mass, g, floor, steps=361)
+        # Stop at the first distance a trajectory had not reached in time
+        truncated = np.isnan(heights).any(axis=0)
+        known = truncated.argmax() if truncated.any() else len(distances)
+        heights, complete = heights[:, :known], known == len(distances)
+        # Columns every trajectory fell short of say nothing about the best angle
+        reached = heights.max(axis=0) > floor
+        heights, distances = heights[:, reached], distances[:known][reached]
+        # Anything reachable further out is reachable closer in too, which also
+        # covers near-vertical shots that the angle grid resolves poorly near x = 0
+        envelope = np.maximum.accumulate(heights.max(axis=0)[::-1])
+        best = angles[np.argmax(heights, axis=0)][::-1]
+        rows.append((envelope, distances[::-1], best, complete))
+    return floor, velocities, rows
+
+def _drag_min_velocity(x, y, valid, drag, mass, g, max_velocity):
+    shape = x.shape
+    x, y, valid = x.ravel(), y.ravel(), valid.ravel()
+    level = _depth_level(y, valid, max_velocity ** 2 / g)
+    floor, velocities, rows = _reach_table(float(drag), float(mass), float(g), float(max_velocity), level)
+    # reach[i] is the furthest distance velocity i gets to at each target height:
+    # 0 above its apex, and its furthest tabulated distance just above the floor
+    reach = np.zeros((len(velocities) + 1,) + x.shape)
+    angle = np.zeros((len(velocities) + 1,) + x.shape)
+    apex = np.zeros((len(velocities) + 1, 1))
+    for i, (envelope, distances, best, complete) in enumerate(rows, start=1):
+        apex[i] = envelope[-1]
+        below = distances[0] if complete else np.nan
+        reach[i] = np.interp(y, envelope, distances, left=below, right=0.0)
+        angle[i] = np.interp(y, envelope, best, left=best[0], right=90.0)
+    # A faster launch can always reach at least as far
+    reach = np.fmax.accumulate(reach, axis=0)
+    j = np.clip(np.count_nonzero(reach < x, axis=0), 1, len(velocities))
+    r1 = np.take_along_axis(reach, j[np.newaxis], 0)[0]
+    # Map reach at the target height to the velocity that would give it in a
+    # vacuum; that mapping is exact without drag and smooth with it, so
+    # velocity is interpolated linearly against it between rows j - 1 and j.
+    # Rows that never get as high as the target map through their apex instead.
+    vacuum = np.where(y > apex, np.sqrt(2 * g * np.maximum(apex, 0)), np.sqrt(g * (y + np.hypot(reach, y))))
+    target = np.sqrt(g * (y + np.hypot(x, y)))
+    grid = np.concatenate(([0.0], velocities))
+    u0 = np.take_along_axis(vacuum, (j - 1)[np.newaxis], 0)[0]
+    u1 = np.take_along_axis(vacuum, j[np.newaxis], 0)[0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frac = np.clip((target - u0) / (u1 - u0), 0, 1)
+    # Below the slowest row, keep its ratio of actual to vacuum velocity
+    frac = np.where(j == 1, 1.0, frac)
+    scale = np.where(j == 1, target / u1, 1.0)
+    velocity = scale * (grid[j - 1] + frac * (grid[j] - grid[j - 1]))
+    # Likewise interpolate each row's departure from the vacuum-optimal angle
+    offset = angle - np.degrees(np.arctan2(y + np.hypot(reach, y), reach))
+    d0 = np.take_along_axis(offset, (j - 1)[np.newaxis], 0)[0]
+    d1 = np.take_along_axis(offset, j[np.newaxis], 0)[0]
+    best_angle = np.degrees(np.arctan2(y + np.hypot(x, y), x)) + d0 + frac * (d1 - d0)
+    unreachable = ~valid | ~np.isfinite(x) | ~np.isfinite(y) | (r1 < x) | (y < floor)
+    velocity[unreachable] = np.nan
+    best_angle[unreachable] = np.nan
+    return velocity.reshape(shape), best_angle.reshape(shape)
+
 # Initialize variables
 initial_angle = 45
 initial_velocity = 50
 initial_mass = 1
 dt = 0.1
 
-# Create the figure and axis
-fig, ax = plt.subplots()
-plt.subplots_adjust(left=0.1, bottom=0.35)
-ax.set_xlim(0, 500)
-ax.set_ylim(0, 100)
-
-particle, = ax.plot([], [], 'bo', markersize=5)
-velocity_text = ax.text(0.02, 0.95, '', transform=ax.transAxes)
-time_text = ax.text(0.02, 0.90, '', transform=ax.transAxes)
-x_distance = ax.text(0.02, 0.85, '', transform=ax.transAxes)
-max_height_text = ax.text(0.02, 0.80, '', transform=ax.transAxes)
-
-# Create sliders
-ax_angle = plt.axes([0.1, 0.2, 0.65, 0.03], facecolor='lightgoldenrodyellow')
-ax_velocity = plt.axes([0.1, 0.25, 0.65, 0.03], facecolor='lightgoldenrodyellow')
-s_angle = Slider(ax_angle, 'Angle (degrees)', 0, 90, valinit=initial_angle)
-s_velocity = Slider(ax_velocity, 'Velocity (m/s)', 0, 100, valinit=initial_velocity)
-
-# Create buttons
-ax_start = plt.axes([0.8, 0.2, 0.1, 0.04])
-ax_stop = plt.axes([0.8, 0.25, 0.1, 0.04])
-ax_reset = plt.axes([0.8, 0.3, 0.1, 0.04])
-b_start = Button(ax_start, 'Start')
-b_stop = Button(ax_stop, 'Stop')
-b_reset = Button(ax_reset, 'Reset')
-
-# Initialize particle
-p = Particle(0, 0, initial_velocity, initial_mass, 0.1, initial_angle)
-anim = None
-
-def init():
-    particle.set_data([], [])
-    velocity_text.set_text('')
-    x_distance.set_text('')
-    max_height_text.set_text('')
-    return particle, velocity_text, time_text, x_distance, max_height_text
-
-def animate(frame):
-    global p
-    p.move(dt)
-    if p.y >= 0:
-        particle.set_data(p.x, p.y)
-        velocity_text.set_text(f'Vx: {p.vx:.2f}, Vy: {p.vy:.2f}')
-        time_text.set_text(f'Time: {frame*dt:.2f}s')
-        x_distance.set_text(f'X-Distance: {p.x:.2f}')
-        max_height_text.set_text(f'Max Height: {p.max_height():.2f}')
-    return particle, velocity_text, time_text, x_distance, max_height_text
-
-
-def start(event):
-    global anim
-    if anim:
-        anim.event_source.start()
-    else:
-        anim = FuncAnimation(fig, animate, init_func=init, frames=np.arange(0, 100, dt), interval=10, blit=True)
+def main():
+    # The solver and Particle don't need matplotlib; only load it for the demo
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+    from matplotlib.widgets import Slider, Button
+
+    # Create the figure and axis
+    fig, ax = plt.subplots()
+    plt.subplots_adjust(left=0.1, bottom=0.35)
+    ax.set_xlim(0, 500)
+    ax.set_ylim(0, 100)
+
+    particle, = ax.plot([], [], 'bo', markersize=5)
+    velocity_text = ax.text(0.02, 0.95, '', transform=ax.transAxes)
+    time_text = ax.text(0.02, 0.90, '', transform=ax.transAxes)
+    x_distance = ax.text(0.02, 0.85, '', transform=ax.transAxes)
+    max_height_text = ax.text(0.02, 0.80, '', transform=ax.transAxes)
+
+    # Create sliders
+    ax_angle = plt.axes([0.1, 0.2, 0.65, 0.03], facecolor='lightgoldenrodyellow')
+    ax_velocity = plt.axes([0.1, 0.25, 0.65, 0.03], facecolor='lightgoldenrodyellow')
+    s_angle = Slider(ax_angle, 'Angle (degrees)', 0, 90, valinit=initial_angle)
+    s_velocity = Slider(ax_velocity, 'Velocity (m/s)', 0, 100, valinit=initial_velocity)
+
+    # Create buttons
+    ax_start = plt.axes([0.8, 0.2, 0.1, 0.04])
+    ax_stop = plt.axes([0.8, 0.25, 0.1, 0.04])
+    ax_reset = plt.axes([0.8, 0.3, 0.1, 0.04])
+    b_start = Button(ax_start, 'Start')
+    b_stop = Button(ax_stop, 'Stop')
+    b_reset = Button(ax_reset, 'Reset')
+
+    # Initialize particle
+    p = Particle(0, 0, initial_velocity, initial_mass, 0.1, initial_angle)
+    anim = None
+
+    def init():
+        particle.set_data([], [])
+        velocity_text.set_text('')
+        x_distance.set_text('')
+        max_height_text.set_text('')
+        return particle, velocity_text, time_text, x_distance, max_height_text
+
+    def animate(frame):
+        p.move(dt)
+        if p.y >= 0:
+            particle.set_data(p.x, p.y)
+            velocity_text.set_text(f'Vx: {p.vx:.2f}, Vy: {p.vy:.2f}')
+            time_text.set_text(f'Time: {frame*dt:.2f}s')
+            x_distance.set_text(f'X-Distance: {p.x:.2f}')
+            max_height_text.set_text(f'Max Height: {p.max_height():.2f}')
+        return particle, velocity_text, time_text, x_distance, max_height_text
+
+
+    def start(event):
+        nonlocal anim
+        if anim:
+            anim.event_source.start()
+        else:
+            anim = FuncAnimation(fig, animate, init_func=init, frames=np.arange(0, 100, dt), interval=10, blit=True)
+            plt.draw()
+
+    def stop(event):
+        if anim:
+            anim.event_source.stop()
+
+    def reset(event):
+        nonlocal p, anim
+        p = Particle(0, 0, s_velocity.val, 1, 0.1, s_angle.val)
+        particle.set_data([], [])
+        velocity_text.set_text('')
+        if anim:
+            anim.event_source.stop()
+            anim = None
         plt.draw()
 
-def stop(event):
-    global anim
-    if anim:
-        anim.event_source.stop()
-
-def reset(event):
-    global p, anim
-    p = Particle(0, 0, s_velocity.val, 1, 0.1, s_angle.val)
-    particle.set_data([], [])
-    velocity_text.set_text('')
-    if anim:
-        anim.event_source.stop()
-        anim = None
-    plt.draw()
-
-b_start.on_clicked(start)
-b_stop.on_clicked(stop)
-b_reset.on_clicked(reset)
-
-# Button to set parameters from a question
-ax_set_params = plt.axes([0.8, 0.15, 0.1, 0.04])
-b_set_params = Button(ax_set_params, 'Set Params')
-
-# Initialize the plot
-init()
-plt.show()
+    b_start.on_clicked(start)
+    b_stop.on_clicked(stop)
+    b_reset.on_clicked(reset)
+
+    # Button to set parameters from a question
+    ax_set_params = plt.axes([0.8, 0.15, 0.1, 0.04])
+    b_set_params = Button(ax_set_params, 'Set Params')
+
+    # Initialize the plot
+    init()
+    plt.show()
+
+if __name__ == "__main__":
+    main()